@@ -10,15 +10,29 @@ Usage:
   List available models:    python server.py config --list-models
 """
 
-import argparse
+import asyncio
+import atexit
+import functools
 import json
 import sys
 import os
 import signal
 import logging
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import SimpleNamespace
+from typing import Callable, Dict, Any, List, Optional, Union
+
+# requests is imported by init_grok() when the server starts
+requests = None
+
+# orjson is optional - much faster JSON for the JSON-RPC hot path
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Server version
 __version__ = "1.3.0"
@@ -26,21 +40,27 @@ __version__ = "1.3.0"
 # xAI API endpoint
 XAI_API_URL = "https://api.x.ai/v1/chat/completions"
 
-# Available Grok models (from xAI API)
-AVAILABLE_MODELS = {
-    "grok-4-1-fast-reasoning": "Grok 4.1 Fast with reasoning (2M context) - Default",
-    "grok-4-1-fast-non-reasoning": "Grok 4.1 Fast without reasoning (2M context)",
-    "grok-4-fast-reasoning": "Grok 4 Fast with reasoning",
-    "grok-4-fast-non-reasoning": "Grok 4 Fast without reasoning",
-    "grok-4-0709": "Grok 4 (July 2025 release)",
-    "grok-3": "Grok 3 - Previous flagship (128K context)",
-    "grok-3-mini": "Grok 3 Mini - Lighter/cheaper option (128K context)",
-    "grok-2-1212": "Grok 2 (128K context)",
-    "grok-2-vision-1212": "Grok 2 Vision (32K context)",
-    "grok-code-fast-1": "Grok Code Fast - Optimized for coding",
-}
+# Available Grok models (from xAI API) as (model, description) pairs in
+# display order. A tuple of constants is folded at compile time, so nothing
+# is built for it at import.
+_MODEL_DESCRIPTIONS = (
+    ("grok-4-1-fast-reasoning", "Grok 4.1 Fast with reasoning (2M context) - Default"),
+    ("grok-4-1-fast-non-reasoning", "Grok 4.1 Fast without reasoning (2M context)"),
+    ("grok-4-fast-reasoning", "Grok 4 Fast with reasoning"),
+    ("grok-4-fast-non-reasoning", "Grok 4 Fast without reasoning"),
+    ("grok-4-0709", "Grok 4 (July 2025 release)"),
+    ("grok-3", "Grok 3 - Previous flagship (128K context)"),
+    ("grok-3-mini", "Grok 3 Mini - Lighter/cheaper option (128K context)"),
+    ("grok-2-1212", "Grok 2 (128K context)"),
+    ("grok-2-vision-1212", "Grok 2 Vision (32K context)"),
+    ("grok-code-fast-1", "Grok Code Fast - Optimized for coding"),
+)
+
+# Only membership is checked outside `config --list-models`
+AVAILABLE_MODELS = frozenset(model for model, _ in _MODEL_DESCRIPTIONS)
 
 # Config file location
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the config file path (cross-platform)"""
     if sys.platform == "win32":
@@ -49,35 +69,49 @@ def get_config_path() -> Path:
         base = Path(os.environ.get("HOME", "~"))
     return base.expanduser() / ".claude-mcp-servers" / "grok" / "config.json"
 
+@functools.lru_cache(maxsize=1)
+def _cached_config() -> Dict[str, Any]:
+    """Read and parse the config file once; later calls reuse the result"""
+    # One read of the whole (small) file; a missing file is just an OSError
+    try:
+        config = json.loads(get_config_path().read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+    # Valid JSON that isn't an object (e.g. [1]) is ignored like a bad file
+    return config if isinstance(config, dict) else {}
+
+def invalidate_config_cache():
+    """Drop the cached config so the next load re-reads the file"""
+    _cached_config.cache_clear()
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from file"""
-    config_path = get_config_path()
-    if config_path.exists():
-        try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-    return {}
+    # Copy so callers can edit it without touching the cache
+    return dict(_cached_config())
 
 def save_config(config: Dict[str, Any]) -> bool:
     """Save configuration to file"""
     config_path = get_config_path()
+    # Write a temp file and swap it in, so a crash never leaves a half-written config
+    tmp_path = config_path.with_suffix(".json.tmp")
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        # Encode first, then write the whole file in one call
+        tmp_path.write_text(json.dumps(config, indent=2))
+        os.replace(tmp_path, config_path)
+        invalidate_config_cache()
         return True
     except IOError as e:
         print(f"Error saving config: {e}", file=sys.stderr)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 def get_default_model() -> str:
     """Get the default model from config file or use fallback"""
-    config = load_config()
-    if "model" in config:
-        return config["model"]
-    return "grok-4-1-fast-reasoning"
+    return _cached_config().get("model", "grok-4-1-fast-reasoning")
 
 def handle_config_command(args) -> int:
     """Handle the config subcommand"""
@@ -85,7 +119,7 @@ def handle_config_command(args) -> int:
         print("Available Grok models:")
         print("-" * 50)
         current = get_default_model()
-        for model, description in AVAILABLE_MODELS.items():
+        for model, description in _MODEL_DESCRIPTIONS:
             marker = " *" if model == current else ""
             print(f"  {model}{marker}")
             print(f"    {description}")
@@ -126,16 +160,62 @@ def handle_config_command(args) -> int:
 # Only configure logging when running as MCP server (not CLI)
 def setup_logging():
     """Configure logging to stderr (stdout is for JSON-RPC)"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        stream=sys.stderr
-    )
+    # LOG_LEVEL=DEBUG shows per-request traces
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=level, handlers=[handler])
     return logging.getLogger(__name__)
 
 # Input limits for security
 MAX_PROMPT_LENGTH = 100000  # 100K characters
 MAX_CODE_LENGTH = 500000    # 500K characters for code review
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024  # 16MB per JSON-RPC line
+STDIN_CHUNK_SIZE = 64 * 1024  # Bytes per read when stdin is read on a thread
+
+# Number of Grok API calls that can be in flight at once
+MAX_CONCURRENT_CALLS = 8
+
+# Streamed text is sent as a progress notification once this much is
+# pending, or when the interval has passed since the last one
+PROGRESS_MIN_CHARS = 1024
+PROGRESS_INTERVAL = 0.25  # seconds
+
+# JSON-RPC wire encoding (config files keep using the stdlib json module)
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _stdlib_json_dumps_line(obj: Any) -> bytes:
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+if orjson is not None:
+    # orjson is stricter than the stdlib: it rejects lone surrogate escapes
+    # (such as half of an emoji sliced by a client) and integers past 64
+    # bits. Those rare inputs fall back to the stdlib instead of failing.
+    def json_loads(data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return _stdlib_json_dumps(obj)
+
+    def json_dumps_line(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return _stdlib_json_dumps_line(obj)
+else:
+    json_loads = json.loads
+    json_dumps = _stdlib_json_dumps
+    json_dumps_line = _stdlib_json_dumps_line
 
 # Default model - loaded from config
 DEFAULT_MODEL = get_default_model()
@@ -144,9 +224,16 @@ DEFAULT_MODEL = get_default_model()
 shutdown_requested = False
 logger = None
 
+# Binary stdout for JSON-RPC responses (set in run_server)
+_STDOUT = None
+_STDOUT_LOCK = threading.Lock()
+
 # API key storage
 API_KEY = None
 
+# Persistent HTTP session, reused across Grok calls (set in init_grok)
+_SESSION: Optional["requests.Session"] = None
+
 def handle_shutdown(signum, frame):
     """Handle shutdown signals gracefully"""
     global shutdown_requested
@@ -160,7 +247,7 @@ GROK_ERROR = ""
 
 def init_grok() -> bool:
     """Initialize Grok API with proper error handling"""
-    global GROK_AVAILABLE, GROK_ERROR, API_KEY
+    global GROK_AVAILABLE, GROK_ERROR, API_KEY, _SESSION, requests
 
     # Get API key from environment
     API_KEY = os.environ.get("XAI_API_KEY")
@@ -170,130 +257,298 @@ def init_grok() -> bool:
             logger.error(GROK_ERROR)
         return False
 
+    # Imported here rather than at the top: requests pulls in urllib3, SSL
+    # and friends, which the config subcommand never needs
+    try:
+        import requests
+    except ImportError:
+        GROK_ERROR = "The requests library is not installed (pip install -r requirements.txt)"
+        if logger:
+            logger.error(GROK_ERROR)
+        return False
+
+    # One session for the server's lifetime keeps connections alive
+    # between tool calls instead of reconnecting to xAI every time.
+    # Size its pool so every concurrent call can keep its own connection.
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", requests.adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_CONCURRENT_CALLS
+    ))
+    _SESSION.headers.update({
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {API_KEY}"
+    })
+    # Resolve proxy and CA bundle settings from the environment once. With
+    # trust_env off, requests stops re-reading them (and ~/.netrc, whose
+    # credentials would replace our Authorization header) on every call.
+    _SESSION.proxies = requests.utils.get_environ_proxies(XAI_API_URL)
+    _SESSION.verify = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or True
+    _SESSION.trust_env = False
+    atexit.register(_SESSION.close)
+
     GROK_AVAILABLE = True
     if logger:
         logger.info(f"Grok API initialized successfully with model: {DEFAULT_MODEL}")
     return True
 
-def send_response(response: Dict[str, Any]):
-    """Send a JSON-RPC response"""
+def encode_response(response: Union[Dict[str, Any], bytes]) -> bytes:
+    """Serialize a response dict; pre-serialized responses pass through"""
+    if isinstance(response, bytes):
+        return response
+    return json_dumps(response)
+
+def send_response(response: Union[Dict[str, Any], bytes, List[Union[Dict[str, Any], bytes]]]):
+    """Send a JSON-RPC response (or batch of responses)"""
     try:
-        print(json.dumps(response), flush=True)
+        # Encode straight into a newline-terminated message so the
+        # (possibly large) payload isn't copied again to append "\n"
+        if isinstance(response, dict):
+            payload = json_dumps_line(response)
+        elif isinstance(response, list):
+            payload = b"[" + b",".join(encode_response(r) for r in response) + b"]\n"
+        else:
+            payload = response + b"\n"
+        # Progress notifications are sent from worker threads, so keep
+        # each message's write and flush together
+        with _STDOUT_LOCK:
+            _STDOUT.write(payload)
+            _STDOUT.flush()
     except Exception as e:
         logger.error(f"Failed to send response: {e}")
 
 def truncate_input(text: str, max_length: int, field_name: str) -> str:
     """Truncate input and log warning if needed"""
-    if len(text) > max_length:
-        logger.warning(f"{field_name} truncated from {len(text)} to {max_length} characters")
-        return text[:max_length]
-    return text
-
-def handle_initialize(request_id: Any) -> Dict[str, Any]:
-    """Handle initialization"""
-    logger.info("Handling initialize request")
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "result": {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {
-                "tools": {},
-                "resources": {},
-                "prompts": {}
-            },
-            "serverInfo": {
-                "name": "grok-mcp",
-                "version": __version__
-            }
-        }
+    length = len(text)
+    if length <= max_length:
+        return text
+
+    logger.warning("%s truncated from %d to %d characters", field_name, length, max_length)
+    return text[:max_length]
+
+def result_prefix(result: Dict[str, Any]) -> bytes:
+    """Serialize a constant result up to the request id, which is spliced in per request"""
+    return json_dumps({"jsonrpc": "2.0", "result": result})[:-1] + b',"id":'
+
+# Only the request id varies between initialize responses
+_INITIALIZE_PREFIX = result_prefix({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {},
+        "resources": {},
+        "prompts": {}
+    },
+    "serverInfo": {
+        "name": "grok-mcp",
+        "version": __version__
     }
-
-def handle_tools_list(request_id: Any) -> Dict[str, Any]:
-    """List available tools"""
-    tools = []
-
-    if GROK_AVAILABLE:
-        tools = [
-            {
-                "name": "ask",
-                "description": "Ask Grok a question and get the response directly in Claude's context. Trigger: 'use grok', 'ask grok', or 'grok:' followed by a question.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "prompt": {
-                            "type": "string",
-                            "description": "The question or prompt for Grok",
-                            "maxLength": MAX_PROMPT_LENGTH
-                        }
-                    },
-                    "required": ["prompt"]
+})
+
+def handle_initialize(request_id: Any, params: Dict[str, Any]) -> bytes:
+    """Handle initialization (returns pre-serialized JSON)"""
+    logger.debug("Handling initialize request")
+    return _INITIALIZE_PREFIX + json_dumps(request_id) + b"}"
+
+# Tool definitions never change at runtime, so build them once
+_TOOLS_AVAILABLE = (
+    {
+        "name": "ask",
+        "description": "Ask Grok a question and get the response directly in Claude's context. Trigger: 'use grok', 'ask grok', or 'grok:' followed by a question.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "prompt": {
+                    "type": "string",
+                    "description": "The question or prompt for Grok",
+                    "maxLength": MAX_PROMPT_LENGTH
                 }
             },
-            {
-                "name": "code_review",
-                "description": "Have Grok review code and return feedback directly to Claude. Trigger: 'grok review', 'grok code review', or 'have grok review'.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "code": {
-                            "type": "string",
-                            "description": "The code to review",
-                            "maxLength": MAX_CODE_LENGTH
-                        },
-                        "focus": {
-                            "type": "string",
-                            "description": "Specific focus area (security, performance, etc.)",
-                            "default": "general"
-                        }
-                    },
-                    "required": ["code"]
+            "required": ["prompt"]
+        }
+    },
+    {
+        "name": "code_review",
+        "description": "Have Grok review code and return feedback directly to Claude. Trigger: 'grok review', 'grok code review', or 'have grok review'.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "code": {
+                    "type": "string",
+                    "description": "The code to review",
+                    "maxLength": MAX_CODE_LENGTH
+                },
+                "focus": {
+                    "type": "string",
+                    "description": "Specific focus area (security, performance, etc.)",
+                    "default": "general"
                 }
             },
-            {
-                "name": "brainstorm",
-                "description": "Brainstorm solutions with Grok, response visible to Claude. Trigger: 'grok brainstorm', 'brainstorm with grok', or 'grok ideas'.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "topic": {
-                            "type": "string",
-                            "description": "The topic to brainstorm about",
-                            "maxLength": MAX_PROMPT_LENGTH
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Additional context",
-                            "default": "",
-                            "maxLength": MAX_PROMPT_LENGTH
-                        }
-                    },
-                    "required": ["topic"]
-                }
-            }
-        ]
-    else:
-        tools = [
-            {
-                "name": "server_info",
-                "description": "Get server status and error information",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
+            "required": ["code"]
+        }
+    },
+    {
+        "name": "brainstorm",
+        "description": "Brainstorm solutions with Grok, response visible to Claude. Trigger: 'grok brainstorm', 'brainstorm with grok', or 'grok ideas'.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "The topic to brainstorm about",
+                    "maxLength": MAX_PROMPT_LENGTH
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Additional context",
+                    "default": "",
+                    "maxLength": MAX_PROMPT_LENGTH
                 }
-            }
-        ]
-
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "result": {
-            "tools": tools
+            },
+            "required": ["topic"]
         }
     }
+)
+
+_TOOLS_UNAVAILABLE = (
+    {
+        "name": "server_info",
+        "description": "Get server status and error information",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+)
+
+# tools/list response pre-serialized up to the request id (set in run_server)
+_TOOLS_LIST_PREFIX = b""
+
+def cache_tools_list():
+    """Serialize the tools/list response once Grok availability is known"""
+    global _TOOLS_LIST_PREFIX
+    tools = _TOOLS_AVAILABLE if GROK_AVAILABLE else _TOOLS_UNAVAILABLE
+    _TOOLS_LIST_PREFIX = result_prefix({"tools": tools})
+
+class InvalidParamsError(ValueError):
+    """Tool arguments don't match the tool's inputSchema"""
+
+# Python types for the JSON Schema types used in inputSchema
+_SCHEMA_TYPES = {
+    "string": str,
+    "object": dict,
+}
+
+def compile_validator(schema: Dict[str, Any]):
+    """Build an argument checker for a tool's inputSchema
+
+    "required" and property types are enforced. Strings over their
+    maxLength are truncated rather than rejected, so the returned
+    arguments may be a trimmed copy of the input.
+    """
+    properties = schema.get("properties", {})
+    required = tuple(schema.get("required", ()))
+    typed = tuple(
+        (name, prop["type"], _SCHEMA_TYPES[prop["type"]])
+        for name, prop in properties.items()
+        if "type" in prop
+    )
+    limits = tuple(
+        (name, prop["maxLength"])
+        for name, prop in properties.items()
+        if "maxLength" in prop
+    )
+
+    def validate(arguments: Any) -> Dict[str, Any]:
+        if not isinstance(arguments, dict):
+            raise InvalidParamsError("arguments must be an object")
+        for name in required:
+            if name not in arguments:
+                raise InvalidParamsError(f"missing required argument: {name}")
+        for name, type_name, py_type in typed:
+            if name in arguments and not isinstance(arguments[name], py_type):
+                raise InvalidParamsError(f"{name} must be of type {type_name}")
+
+        # Only oversized fields pay for a copy and a truncate_input call
+        trimmed = None
+        for name, max_length in limits:
+            value = arguments.get(name)
+            if value is not None and len(value) > max_length:
+                if trimmed is None:
+                    trimmed = dict(arguments)
+                trimmed[name] = truncate_input(value, max_length, name)
+        return arguments if trimmed is None else trimmed
+
+    return validate
+
+# Argument validators, compiled once per tool
+_VALIDATORS = {
+    tool["name"]: compile_validator(tool["inputSchema"])
+    for tool in _TOOLS_AVAILABLE + _TOOLS_UNAVAILABLE
+}
+
+def handle_tools_list(request_id: Any, params: Dict[str, Any]) -> bytes:
+    """List available tools (returns pre-serialized JSON)"""
+    return _TOOLS_LIST_PREFIX + json_dumps(request_id) + b"}"
+
+# Request fields that are the same for every call
+_PAYLOAD_TEMPLATE = {
+    "model": DEFAULT_MODEL,
+    "stream": True,
+    "temperature": 0.7
+}
+
+def read_stream(response: "requests.Response", on_chunk: Optional[Callable[[str], None]] = None) -> str:
+    """Collect a streamed (SSE) completion, passing each text delta to on_chunk"""
+    parts = []
+    last_frame = None
+    lines = response.iter_lines()
+    for line in lines:
+        # Stop streaming on SIGTERM/SIGINT instead of holding up exit until
+        # the completion finishes; call_grok closes the connection
+        if shutdown_requested:
+            return "Error calling Grok: server shutting down"
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            # Read to the end of the chunked body so the connection goes
+            # back to the session's pool instead of being closed
+            for _ in lines:
+                pass
+            break
 
-def call_grok(prompt: str, system_prompt: Optional[str] = None) -> str:
-    """Call Grok API directly via HTTP and return response"""
+        last_frame = json_loads(data)
+        error = last_frame.get("error")
+        if error:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            logger.error(f"Grok returned an error: {message}")
+            for _ in lines:
+                pass
+            return f"Error calling Grok: {message}"
+
+        choices = last_frame.get("choices")
+        if choices:
+            text = choices[0].get("delta", {}).get("content")
+            if text:
+                parts.append(text)
+                if on_chunk is not None:
+                    on_chunk(text)
+
+    if last_frame is None:
+        return "Unexpected response format: no data in response stream"
+    if not parts:
+        logger.error(f"Unexpected response format: {last_frame}")
+        return f"Unexpected response format: {last_frame}"
+    return "".join(parts)
+
+def call_grok(prompt: str, system_prompt: Optional[str] = None,
+              on_chunk: Optional[Callable[[str], None]] = None) -> str:
+    """Call Grok API directly via HTTP and return response
+
+    The response is always streamed, so long generations keep the
+    connection active instead of hitting the read timeout. If on_chunk
+    is given it is called with each piece of text as it arrives.
+    """
     try:
         # Build messages array
         messages = []
@@ -301,37 +556,26 @@ def call_grok(prompt: str, system_prompt: Optional[str] = None) -> str:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        # Build request payload
-        payload = {
-            "model": DEFAULT_MODEL,
-            "messages": messages,
-            "stream": False,
-            "temperature": 0.7
-        }
+        # Build request payload on top of the fixed fields
+        payload = {**_PAYLOAD_TEMPLATE, "messages": messages}
 
-        # Make request using requests library
-        response = requests.post(
+        # Make request using the shared session
+        # Encode with json_dumps (orjson when available) rather than letting
+        # requests run the stdlib encoder over up to 500K characters of code
+        response = _SESSION.post(
             XAI_API_URL,
-            json=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {API_KEY}"
-            },
-            timeout=120
+            data=json_dumps(payload),
+            timeout=120,
+            stream=True
         )
 
-        # Check for errors
-        if response.status_code != 200:
-            logger.error(f"HTTP error calling Grok: {response.status_code} - {response.text}")
-            return f"Error calling Grok (HTTP {response.status_code}): {response.text}"
+        with response:
+            # Check for errors
+            if response.status_code != 200:
+                logger.error(f"HTTP error calling Grok: {response.status_code} - {response.text}")
+                return f"Error calling Grok (HTTP {response.status_code}): {response.text}"
 
-        result = response.json()
-
-        # Extract response content
-        if "choices" in result and len(result["choices"]) > 0:
-            return result["choices"][0]["message"]["content"]
-        else:
-            return f"Unexpected response format: {result}"
+            return read_stream(response, on_chunk)
 
     except requests.exceptions.Timeout:
         logger.error("Timeout calling Grok")
@@ -343,48 +587,12 @@ def call_grok(prompt: str, system_prompt: Optional[str] = None) -> str:
         logger.error(f"Error calling Grok: {e}")
         return f"Error calling Grok: {str(e)}"
 
-def handle_tool_call(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle tool execution"""
-    tool_name = params.get("name")
-    arguments = params.get("arguments", {})
-
-    logger.info(f"Handling tool call: {tool_name}")
-
-    try:
-        result = ""
-
-        if tool_name == "server_info":
-            if GROK_AVAILABLE:
-                result = f"Server v{__version__} - Grok connected and ready! Model: {DEFAULT_MODEL}"
-            else:
-                result = f"Server v{__version__} - Grok error: {GROK_ERROR}"
-
-        elif tool_name == "ask":
-            if not GROK_AVAILABLE:
-                result = f"Grok not available: {GROK_ERROR}"
-            else:
-                prompt = arguments.get("prompt", "")
-                prompt = truncate_input(prompt, MAX_PROMPT_LENGTH, "prompt")
-                if not prompt.strip():
-                    raise ValueError("prompt cannot be empty")
-                result = call_grok(prompt)
-
-        elif tool_name == "code_review":
-            if not GROK_AVAILABLE:
-                result = f"Grok not available: {GROK_ERROR}"
-            else:
-                code = arguments.get("code", "")
-                code = truncate_input(code, MAX_CODE_LENGTH, "code")
-                if not code.strip():
-                    raise ValueError("code cannot be empty")
-                focus = arguments.get("focus", "general")
-                # Sanitize focus to prevent prompt injection
-                focus = focus[:50].replace("\n", " ").strip() or "general"
-
-                prompt = f"""Please review this code with a focus on {focus}:
-
-```
-{code}
+# Prompt templates, split around the user-supplied parts so each prompt
+# is assembled with a single join
+_REVIEW_SYSTEM_PROMPT = "You are an expert code reviewer."
+_REVIEW_PRE = "Please review this code with a focus on "
+_REVIEW_MID = ":\n\n```\n"
+_REVIEW_POST = """
 ```
 
 Provide specific, actionable feedback on:
@@ -393,28 +601,149 @@ Provide specific, actionable feedback on:
 3. Performance optimizations
 4. Best practices
 5. Code clarity and maintainability"""
-                result = call_grok(prompt, "You are an expert code reviewer.")
-
-        elif tool_name == "brainstorm":
-            if not GROK_AVAILABLE:
-                result = f"Grok not available: {GROK_ERROR}"
-            else:
-                topic = arguments.get("topic", "")
-                topic = truncate_input(topic, MAX_PROMPT_LENGTH, "topic")
-                if not topic.strip():
-                    raise ValueError("topic cannot be empty")
-                context = arguments.get("context", "")
-                context = truncate_input(context, MAX_PROMPT_LENGTH, "context")
-
-                prompt = f"Let's brainstorm about: {topic}"
-                if context:
-                    prompt += f"\n\nContext: {context}"
-                prompt += "\n\nProvide creative ideas, alternatives, and considerations."
-                result = call_grok(prompt, "You are a creative problem solver and brainstorming partner.")
 
-        else:
+_BRAINSTORM_SYSTEM_PROMPT = "You are a creative problem solver and brainstorming partner."
+_BRAINSTORM_PRE = "Let's brainstorm about: "
+_BRAINSTORM_CONTEXT = "\n\nContext: "
+_BRAINSTORM_POST = "\n\nProvide creative ideas, alternatives, and considerations."
+
+# Callback receiving each chunk of Grok's reply while it streams
+ProgressCallback = Optional[Callable[[str], None]]
+
+def requires_grok(handler):
+    """Short-circuit a tool handler when the Grok API isn't available"""
+    @functools.wraps(handler)
+    def wrapper(arguments: Dict[str, Any], on_chunk: ProgressCallback = None) -> str:
+        if not GROK_AVAILABLE:
+            return f"Grok not available: {GROK_ERROR}"
+        return handler(arguments, on_chunk)
+    wrapper.requires_grok = True
+    return wrapper
+
+def tool_server_info(arguments: Dict[str, Any], on_chunk: ProgressCallback = None) -> str:
+    """Report server status"""
+    if GROK_AVAILABLE:
+        return f"Server v{__version__} - Grok connected and ready! Model: {DEFAULT_MODEL}"
+    return f"Server v{__version__} - Grok error: {GROK_ERROR}"
+
+@requires_grok
+def tool_ask(arguments: Dict[str, Any], on_chunk: ProgressCallback = None) -> str:
+    """Ask Grok a question"""
+    prompt = arguments.get("prompt", "")
+    if not prompt.strip():
+        raise ValueError("prompt cannot be empty")
+    return call_grok(prompt, on_chunk=on_chunk)
+
+@requires_grok
+def tool_code_review(arguments: Dict[str, Any], on_chunk: ProgressCallback = None) -> str:
+    """Have Grok review code"""
+    code = arguments.get("code", "")
+    if not code.strip():
+        raise ValueError("code cannot be empty")
+    focus = arguments.get("focus", "general")
+    # Sanitize focus to prevent prompt injection
+    focus = focus[:50].replace("\n", " ").strip() or "general"
+
+    prompt = "".join((_REVIEW_PRE, focus, _REVIEW_MID, code, _REVIEW_POST))
+    return call_grok(prompt, _REVIEW_SYSTEM_PROMPT, on_chunk)
+
+@requires_grok
+def tool_brainstorm(arguments: Dict[str, Any], on_chunk: ProgressCallback = None) -> str:
+    """Brainstorm with Grok"""
+    topic = arguments.get("topic", "")
+    if not topic.strip():
+        raise ValueError("topic cannot be empty")
+    context = arguments.get("context", "")
+
+    if context:
+        prompt = "".join((_BRAINSTORM_PRE, topic, _BRAINSTORM_CONTEXT, context, _BRAINSTORM_POST))
+    else:
+        prompt = "".join((_BRAINSTORM_PRE, topic, _BRAINSTORM_POST))
+    return call_grok(prompt, _BRAINSTORM_SYSTEM_PROMPT, on_chunk)
+
+# Tool name -> handler taking the call's arguments (and an optional progress
+# callback) and returning result text
+TOOL_HANDLERS = {
+    "server_info": tool_server_info,
+    "ask": tool_ask,
+    "code_review": tool_code_review,
+    "brainstorm": tool_brainstorm,
+}
+
+# Header shown above every tool result in Claude's context
+_RESPONSE_PREFIX = "GROK RESPONSE:\n\n"
+
+class ProgressNotifier:
+    """Send streamed text as progress notifications, coalescing small deltas
+
+    Grok streams a few tokens per SSE frame, so deltas are buffered and
+    sent together; flush() sends whatever is still pending.
+    """
+
+    def __init__(self, progress_token: Any):
+        self.progress_token = progress_token
+        self.pending: List[str] = []
+        self.pending_chars = 0
+        self.received = 0
+        # Zero so the first delta goes out right away
+        self.last_sent = 0.0
+
+    def __call__(self, text: str):
+        self.pending.append(text)
+        self.pending_chars += len(text)
+        self.received += len(text)
+        if (self.pending_chars >= PROGRESS_MIN_CHARS
+                or time.monotonic() - self.last_sent >= PROGRESS_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        text = "".join(self.pending)
+        self.pending.clear()
+        self.pending_chars = 0
+        self.last_sent = time.monotonic()
+        send_response({
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {
+                "progressToken": self.progress_token,
+                "progress": self.received,
+                "message": text
+            }
+        })
+
+def handle_tool_call(request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Handle tool execution"""
+    tool_name = params.get("name")
+    # Missing and null arguments both mean "no arguments"
+    arguments = params.get("arguments") or {}
+
+    logger.debug("Handling tool call: %s", tool_name)
+
+    try:
+        handler = TOOL_HANDLERS.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
+        # Checks the arguments and trims any over their maxLength. Skipped
+        # when Grok is down, so the tool can report that instead.
+        validate = _VALIDATORS.get(tool_name)
+        if validate is not None and (GROK_AVAILABLE or not getattr(handler, "requires_grok", False)):
+            arguments = validate(arguments)
+
+        # Clients that pass a progressToken get the reply as it streams in
+        on_chunk = None
+        progress_token = (params.get("_meta") or {}).get("progressToken")
+        if progress_token is not None:
+            on_chunk = ProgressNotifier(progress_token)
+
+        result = handler(arguments, on_chunk)
+
+        # Text still buffered goes out before the final response
+        if on_chunk is not None:
+            on_chunk.flush()
+
         return {
             "jsonrpc": "2.0",
             "id": request_id,
@@ -422,11 +751,21 @@ Provide specific, actionable feedback on:
                 "content": [
                     {
                         "type": "text",
-                        "text": f"GROK RESPONSE:\n\n{result}"
+                        "text": _RESPONSE_PREFIX + result
                     }
                 ]
             }
         }
+    except InvalidParamsError as e:
+        logger.warning(f"Invalid arguments for {tool_name}: {e}")
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {
+                "code": -32602,
+                "message": f"Invalid params: {e}"
+            }
+        }
     except Exception as e:
         logger.error(f"Tool call error for {tool_name}: {e}")
         return {
@@ -438,10 +777,174 @@ Provide specific, actionable feedback on:
             }
         }
 
-def main():
-    """Main server loop"""
-    global shutdown_requested
+async def open_stdin_reader() -> asyncio.StreamReader:
+    """Wrap stdin in an asyncio StreamReader"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_MESSAGE_SIZE)
+
+    if sys.platform != "win32":
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+            return reader
+        except (OSError, ValueError, NotImplementedError) as e:
+            logger.debug(f"Cannot attach stdin to event loop ({e}), using reader thread")
+
+    # Windows pipes (and regular files) can't be watched by the event loop,
+    # so feed the reader from a background thread instead. Raw chunks are
+    # passed through as they arrive and the StreamReader splits the lines,
+    # so there's one hand-off to the loop per read rather than per message.
+    def pump():
+        read = sys.stdin.buffer.read1
+        try:
+            for chunk in iter(lambda: read(STDIN_CHUNK_SIZE), b""):
+                loop.call_soon_threadsafe(reader.feed_data, chunk)
+        finally:
+            loop.call_soon_threadsafe(reader.feed_eof)
+
+    threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+    return reader
+
+_RESOURCES_LIST_PREFIX = result_prefix({"resources": []})
+_PROMPTS_LIST_PREFIX = result_prefix({"prompts": []})
+
+def handle_resources_list(request_id: Any, params: Dict[str, Any]) -> bytes:
+    """Return empty resources list"""
+    return _RESOURCES_LIST_PREFIX + json_dumps(request_id) + b"}"
+
+def handle_prompts_list(request_id: Any, params: Dict[str, Any]) -> bytes:
+    """Return empty prompts list"""
+    return _PROMPTS_LIST_PREFIX + json_dumps(request_id) + b"}"
+
+def start_tool_call(request_id: Any, params: Dict[str, Any]) -> asyncio.Future:
+    """Run a tool call on the worker pool (Grok calls block on HTTP)"""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, handle_tool_call, request_id, params)
+
+def handle_initialized(params: Dict[str, Any]):
+    """Client finished initializing"""
+    logger.debug("Client initialized notification received")
+
+def handle_cancelled(params: Dict[str, Any]):
+    """Client cancelled a request"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request cancelled: %s", params.get("requestId"))
+
+# JSON-RPC method -> handler(request_id, params). A handler may return a
+# future for work that runs off the event loop.
+METHOD_HANDLERS = {
+    "initialize": handle_initialize,
+    "tools/list": handle_tools_list,
+    "tools/call": start_tool_call,
+    "resources/list": handle_resources_list,
+    "prompts/list": handle_prompts_list,
+}
+
+# Notification method -> handler(params); notifications get no response
+NOTIFICATION_HANDLERS = {
+    "notifications/initialized": handle_initialized,
+    "notifications/cancelled": handle_cancelled,
+}
+
+async def dispatch(request: Any) -> Optional[Union[Dict[str, Any], bytes]]:
+    """Handle a single JSON-RPC request, returning None for notifications"""
+    if not isinstance(request, dict):
+        return {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "Invalid Request"
+            }
+        }
+
+    method = request.get("method")
+    request_id = request.get("id")
+    params = request.get("params", {})
+
+    try:
+        # Handle notifications (no response needed)
+        notify = NOTIFICATION_HANDLERS.get(method)
+        if notify is not None:
+            notify(params)
+            return None
+        if "id" not in request:
+            logger.debug("Ignoring notification: %s", method)
+            return None
+
+        # Handle requests (response required)
+        handler = METHOD_HANDLERS.get(method)
+        if handler is None:
+            logger.warning(f"Unknown method: {method}")
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
+                }
+            }
+
+        response = handler(request_id, params)
+        if asyncio.isfuture(response):
+            response = await response
+        return response
+
+    except Exception as e:
+        logger.error(f"Unexpected error handling {method}: {e}")
+        if request_id is None:
+            return None
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }
+        }
+
+def has_float_id(request: Any) -> bool:
+    """Check whether any message in a request (or batch) has a float id"""
+    messages = request if isinstance(request, list) else (request,)
+    return any(isinstance(m, dict) and isinstance(m.get("id"), float) for m in messages)
 
+async def handle_message(line: bytes):
+    """Parse one JSON-RPC message (or batch) and send its response"""
+    try:
+        request = json_loads(line)
+        # orjson reads integers past 64 bits as floats; re-parse with the
+        # stdlib so the response id matches the request exactly
+        if orjson is not None and has_float_id(request):
+            request = json.loads(line)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.warning(f"Invalid JSON received: {e}")
+        return
+
+    if not isinstance(request, list):
+        response = await dispatch(request)
+        if response is not None:
+            send_response(response)
+        return
+
+    # Batch request: run every element in parallel, reply with one array
+    if not request:
+        send_response({
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "Invalid Request: empty batch"
+            }
+        })
+        return
+
+    results = await asyncio.gather(*(dispatch(item) for item in request))
+    responses = [r for r in results if r is not None]
+    if responses:
+        send_response(responses)
+
+async def main():
+    """Main server loop"""
     logger.info(f"Starting Grok MCP server v{__version__}")
     logger.info(f"Using direct HTTP API (no SDK)")
     logger.info(f"Model: {DEFAULT_MODEL}")
@@ -449,96 +952,93 @@ def main():
     if not GROK_AVAILABLE:
         logger.warning(f"Grok initialization failed: {GROK_ERROR}")
 
-    while not shutdown_requested:
+    # Tool calls run on this pool so slow Grok requests don't block stdin
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS, thread_name_prefix="grok")
+    loop.set_default_executor(executor)
+
+    reader = await open_stdin_reader()
+    tasks = set()
+    main_task = asyncio.current_task()
+
+    def cancel_all(signum):
+        """Stop reading stdin and cancel in-flight requests right away"""
+        handle_shutdown(signum, None)
+        for task in tasks:
+            task.cancel()
+        main_task.cancel()
+
+    # The event loop wakes on signals itself, so shutdown doesn't wait for
+    # the next stdin line. Windows lacks this and keeps the flag handlers.
+    for signum in (signal.SIGTERM, signal.SIGINT):
         try:
-            line = sys.stdin.readline()
-            if not line:
-                logger.info("EOF received, shutting down")
-                break
+            loop.add_signal_handler(signum, cancel_all, signum)
+        except (NotImplementedError, RuntimeError):
+            pass
 
-            line = line.strip()
-            if not line:
-                continue
+    # Bind hot-loop lookups to locals once instead of per message
+    readline = reader.readline
+    create_task = asyncio.create_task
+    handle = handle_message
+    track = tasks.add
+    untrack = tasks.discard
 
+    try:
+        while not shutdown_requested:
             try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Invalid JSON received: {e}")
+                line = await readline()
+            except ValueError as e:
+                logger.warning(f"Message too large, skipped: {e}")
                 continue
 
-            method = request.get("method")
-            request_id = request.get("id")
-            params = request.get("params", {})
+            if not line:
+                logger.info("EOF received, shutting down")
+                break
 
-            # Handle notifications (no response needed)
-            if method == "notifications/initialized":
-                logger.info("Client initialized notification received")
+            # The JSON parsers skip surrounding whitespace themselves, so the
+            # raw line (up to MAX_MESSAGE_SIZE) is passed on without a
+            # strip() copy
+            if line.isspace():
                 continue
-            elif method == "notifications/cancelled":
-                logger.info(f"Request cancelled: {params.get('requestId')}")
+
+            # notifications/initialized needs no reply, so skip parsing it.
+            # The method pair must appear unescaped (so not inside a string
+            # value) and the line must have no "id": without one the message
+            # can only be a notification, so nothing that expects a reply
+            # is ever dropped.
+            if (len(line) < 256 and line.lstrip()[:1] == b"{"
+                    and b'"method":"notifications/initialized"' in line
+                    and b'"id"' not in line):
                 continue
 
-            # Handle requests (response required)
-            if method == "initialize":
-                response = handle_initialize(request_id)
-            elif method == "tools/list":
-                response = handle_tools_list(request_id)
-            elif method == "tools/call":
-                response = handle_tool_call(request_id, params)
-            elif method == "resources/list":
-                # Return empty resources list
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"resources": []}
-                }
-            elif method == "prompts/list":
-                # Return empty prompts list
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"prompts": []}
-                }
-            else:
-                logger.warning(f"Unknown method: {method}")
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                }
+            # Each message is handled concurrently; track it so shutdown can wait
+            task = create_task(handle(line))
+            track(task)
+            task.add_done_callback(untrack)
+    except asyncio.CancelledError:
+        logger.info("Cancelled in-flight requests")
 
-            send_response(response)
+    if tasks:
+        logger.info(f"Waiting for {len(tasks)} in-flight request(s)")
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            logger.info("Cancelled in-flight requests")
 
-        except EOFError:
-            logger.info("EOF received, shutting down")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error in main loop: {e}")
-            if 'request_id' in locals() and request_id is not None:
-                send_response({
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
-                    }
-                })
+    # Drop tool calls that were queued but never started
+    executor.shutdown(wait=False, cancel_futures=True)
 
     logger.info("Server shutdown complete")
 
 def run_server():
     """Initialize and run the MCP server"""
-    global logger
+    global logger, _STDOUT
 
     # Setup logging for server mode
     logger = setup_logging()
 
-    # Ensure unbuffered output for MCP protocol
-    sys.stdout = os.fdopen(sys.stdout.fileno(), 'w', 1)
-    sys.stderr = os.fdopen(sys.stderr.fileno(), 'w', 1)
+    # Responses are written as pre-encoded bytes and flushed per message
+    _STDOUT = sys.stdout.buffer
 
     # Register signal handlers
     signal.signal(signal.SIGTERM, handle_shutdown)
@@ -546,32 +1046,86 @@ def run_server():
 
     # Initialize Grok API
     init_grok()
+    cache_tools_list()
 
     # Run main loop
-    main()
+    asyncio.run(main())
+
+CLI_USAGE = "usage: server.py [-h] [config [--model MODEL] [--show] [--list-models]]"
+
+CLI_HELP = CLI_USAGE + """
+
+Grok MCP Server for Claude Code
+
+commands:
+  config                  Configure the Grok MCP server
+    -m, --model MODEL     Set the default Grok model
+    -s, --show            Show current configuration
+    -l, --list-models     List available models
 
-if __name__ == "__main__":
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(
-        description="Grok MCP Server for Claude Code",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
   python server.py                                       Run as MCP server
   python server.py config --model grok-4-1-fast-reasoning  Set default model
   python server.py config --show                         Show current config
-  python server.py config --list-models                  List available models
-        """
-    )
-    subparsers = parser.add_subparsers(dest="command")
+  python server.py config --list-models                  List available models"""
+
+def cli_error(message: str):
+    """Print a usage error and exit like argparse does"""
+    print(CLI_USAGE, file=sys.stderr)
+    print(f"server.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+CONFIG_HELP = """usage: server.py config [-h] [--model MODEL] [--show] [--list-models]
+
+options:
+  -h, --help            show this help message and exit
+  --model MODEL, -m MODEL
+                        Set the default Grok model
+  --show, -s            Show current configuration
+  --list-models, -l     List available models"""
+
+def print_help(text: str):
+    """Print help text and exit like argparse does"""
+    print(text)
+    sys.exit(0)
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse the command line
+
+    There is one subcommand with three flags, so a small hand-written
+    parser replaces argparse and keeps server startup fast.
+    """
+    args = SimpleNamespace(command=None, model=None, show=False, list_models=False)
+    if not argv:
+        return args
+
+    if argv[0] in ("-h", "--help"):
+        print_help(CLI_HELP)
+    if argv[0] != "config":
+        cli_error(f"argument command: invalid choice: '{argv[0]}' (choose from 'config')")
+
+    args.command = "config"
+    rest = iter(argv[1:])
+    for arg in rest:
+        if arg in ("-h", "--help"):
+            print_help(CONFIG_HELP)
+        elif arg in ("-s", "--show"):
+            args.show = True
+        elif arg in ("-l", "--list-models"):
+            args.list_models = True
+        elif arg in ("-m", "--model"):
+            args.model = next(rest, None)
+            if args.model is None:
+                cli_error("argument --model/-m: expected one argument")
+        elif arg.startswith("--model="):
+            args.model = arg[len("--model="):]
+        else:
+            cli_error(f"unrecognized arguments: {arg}")
 
-    # Config subcommand
-    config_parser = subparsers.add_parser("config", help="Configure the Grok MCP server")
-    config_parser.add_argument("--model", "-m", help="Set the default Grok model")
-    config_parser.add_argument("--show", "-s", action="store_true", help="Show current configuration")
-    config_parser.add_argument("--list-models", "-l", action="store_true", help="List available models")
+    return args
 
-    args = parser.parse_args()
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
 
     if args.command == "config":
         sys.exit(handle_config_command(args))